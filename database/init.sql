@@ -26,6 +26,8 @@ CREATE TABLE IF NOT EXISTS audit_findings (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX idx_audit_jobs_status ON audit_jobs(status);
 CREATE INDEX idx_audit_findings_job_id ON audit_findings(job_id);
+CREATE INDEX idx_audit_findings_job_created ON audit_findings(job_id, created_at DESC, id DESC);
 CREATE INDEX idx_audit_findings_created_at ON audit_findings(created_at);
 CREATE INDEX idx_audit_findings_severity ON audit_findings(severity);
\ No newline at end of file
@@ -1,18 +1,22 @@
 # orchestrator/main.py
 import os
-import uuid
+import time
 import json
 import asyncio
 import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
-import redis
+import orjson
+import redis.asyncio as aioredis
 import asyncpg
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 from contextlib import asynccontextmanager
+from anyio import to_thread
 
 # Configure logging
 logging.basicConfig(
@@ -23,12 +27,24 @@ logger = logging.getLogger(__name__)
 
 # Models
 class AuditRequest(BaseModel):
-    cloud_provider: str = Field(..., regex="^(azure|aws|gcp)$")
+    cloud_provider: str = Field(..., pattern="^(azure|aws|gcp)$")
     subscription_id: Optional[str] = None
     account_id: Optional[str] = None
     project_id: Optional[str] = None
     checks: List[str] = Field(default=["security", "compliance"])
-    priority: str = Field(default="medium", regex="^(low|medium|high)$")
+    priority: str = Field(default="medium", pattern="^(low|medium|high)$")
+
+    @model_validator(mode="after")
+    def _check_cloud_id(self):
+        """Each provider requires its matching identifier"""
+        required = {
+            "azure": "subscription_id",
+            "aws": "account_id",
+            "gcp": "project_id"
+        }[self.cloud_provider]
+        if not getattr(self, required):
+            raise ValueError(f"{required} required for {self.cloud_provider}")
+        return self
 
 class AuditJobResponse(BaseModel):
     job_id: str
@@ -43,30 +59,124 @@ class HealthResponse(BaseModel):
     version: str = "1.0.0"
     uptime: float
 
+# SQL statements
+# Module-level constants so asyncpg's per-connection statement cache
+# (keyed by query text) reuses the prepared plan on every call
+INSERT_JOB_SQL = """
+    INSERT INTO audit_jobs
+    (job_id, cloud_provider, subscription_id, account_id, project_id, checks, status)
+    VALUES ($1, $2, $3, $4, $5, $6, 'queued')
+"""
+
+INSERT_FAILED_JOB_SQL = """
+    INSERT INTO audit_jobs
+    (job_id, cloud_provider, subscription_id, account_id, project_id, checks, status, error_message)
+    VALUES ($1, $2, $3, $4, $5, $6, 'failed', $7)
+"""
+
+JOB_STATUS_SQL = """
+    SELECT j.*,
+           (SELECT COUNT(*) FROM audit_findings f
+            WHERE f.job_id = j.job_id) AS findings_count
+    FROM audit_jobs j WHERE j.job_id = $1
+"""
+
+JOB_EXISTS_SQL = "SELECT job_id FROM audit_jobs WHERE job_id = $1"
+
+BATCH_STATUS_SQL = """
+    SELECT job_id, status, cloud_provider, created_at, started_at, completed_at
+    FROM audit_jobs WHERE job_id = ANY($1::text[])
+"""
+
+BATCH_FINDINGS_COUNT_SQL = """
+    SELECT job_id, COUNT(*) AS findings_count
+    FROM audit_findings WHERE job_id = ANY($1::text[])
+    GROUP BY job_id
+"""
+
+FINDINGS_SQL = """
+    SELECT * FROM audit_findings WHERE job_id = $1
+    ORDER BY created_at DESC, id DESC LIMIT $2
+"""
+
+FINDINGS_AFTER_SQL = """
+    SELECT * FROM audit_findings
+    WHERE job_id = $1 AND (created_at, id) < ($2, $3)
+    ORDER BY created_at DESC, id DESC LIMIT $4
+"""
+
+FINDINGS_BY_SEVERITY_SQL = """
+    SELECT * FROM audit_findings WHERE job_id = $1 AND severity = $2
+    ORDER BY created_at DESC, id DESC LIMIT $3
+"""
+
+FINDINGS_BY_SEVERITY_AFTER_SQL = """
+    SELECT * FROM audit_findings
+    WHERE job_id = $1 AND severity = $2 AND (created_at, id) < ($3, $4)
+    ORDER BY created_at DESC, id DESC LIMIT $5
+"""
+
+JOB_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_jobs,
+        COUNT(*) FILTER (WHERE status = 'completed') as completed_jobs,
+        COUNT(*) FILTER (WHERE status = 'failed') as failed_jobs
+    FROM audit_jobs
+"""
+
+FINDING_STATS_SQL = """
+    SELECT
+        COUNT(*) as total_findings,
+        COUNT(*) FILTER (WHERE severity = 'high') as high_findings,
+        COUNT(*) FILTER (WHERE severity = 'medium') as medium_findings,
+        COUNT(*) FILTER (WHERE severity = 'low') as low_findings
+    FROM audit_findings
+"""
+
 # Global connections
 redis_pool = None
+redis_client = None
 pg_pool = None
 start_time = datetime.now()
 
+# Short-TTL cache for /metrics so concurrent dashboard/scraper polls
+# collapse to one set of DB/Redis round-trips
+METRICS_CACHE_TTL = 2.0
+_metrics_cache = {"ts": 0.0, "value": None}
+_metrics_lock = asyncio.Lock()
+
+# Heartbeat state kept fresh by a background refresher so /health
+# probes don't hit Redis/Postgres themselves
+HEALTH_REFRESH_INTERVAL = 1.0
+_health = {"redis": False, "postgres": False}
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    global redis_pool, pg_pool
-    
+    global redis_pool, redis_client, pg_pool
+
+    # Cap the AnyIO threadpool (default 40) that FastAPI uses for sync
+    # work so threads can never outnumber the asyncpg pool (max 20) and
+    # pile up on the GIL
+    to_thread.current_default_thread_limiter().total_tokens = 20
+
     # Initialize Redis
     try:
-        redis_pool = redis.ConnectionPool(
+        redis_pool = aioredis.ConnectionPool(
             host=os.getenv("REDIS_HOST", "localhost"),
             port=int(os.getenv("REDIS_PORT", "6379")),
             decode_responses=True,
             max_connections=20
         )
-        r = redis.Redis(connection_pool=redis_pool)
-        r.ping()
+        # One shared client for the process — re-wrapping the pool per
+        # call allocates fresh parser state each time
+        redis_client = aioredis.Redis(connection_pool=redis_pool)
+        await redis_client.ping()
         logger.info("Redis connected successfully")
     except Exception as e:
         logger.error(f"Redis connection failed: {e}")
         redis_pool = None
+        redis_client = None
     
     # Initialize PostgreSQL
     try:
@@ -77,7 +187,9 @@ async def lifespan(app: FastAPI):
             user=os.getenv("POSTGRES_USER", "audituser"),
             password=os.getenv("POSTGRES_PASSWORD", "auditpass"),
             min_size=5,
-            max_size=20
+            max_size=20,
+            statement_cache_size=1024,
+            max_cacheable_statement_size=1024 * 15
         )
         async with pg_pool.acquire() as conn:
             await conn.fetch("SELECT 1")
@@ -85,12 +197,19 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"PostgreSQL connection failed: {e}")
         pg_pool = None
-    
+
+    # One monitor coroutine for the process lifetime (previously a new
+    # never-ending polling coroutine was spawned per /audit request)
+    monitor_task = asyncio.create_task(process_audit_tasks())
+    health_task = asyncio.create_task(_health_refresher())
+
     yield
-    
+
     # Shutdown
+    monitor_task.cancel()
+    health_task.cancel()
     if redis_pool:
-        redis_pool.disconnect()
+        await redis_pool.disconnect()
     if pg_pool:
         await pg_pool.close()
 
@@ -99,7 +218,8 @@ app = FastAPI(
     title="Agentic Cloud Auditor",
     description="Minimal deployable cloud auditing system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -111,40 +231,54 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Findings payloads are large and highly repetitive (same keys per row)
+# — gzip typically shrinks them 5-10x
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 def get_redis():
-    if not redis_pool:
+    if not redis_client:
         raise HTTPException(status_code=503, detail="Redis unavailable")
-    return redis.Redis(connection_pool=redis_pool)
+    return redis_client
 
-async def get_pg_connection():
+def get_pool():
     if not pg_pool:
         raise HTTPException(status_code=503, detail="PostgreSQL unavailable")
     return pg_pool
 
+async def _health_refresher():
+    """Probe Redis and PostgreSQL once a second and cache the results"""
+    while True:
+        # Check Redis
+        redis_ok = False
+        if redis_client:
+            try:
+                redis_ok = await redis_client.ping()
+            except:
+                redis_ok = False
+
+        # Check PostgreSQL
+        postgres_ok = False
+        if pg_pool:
+            try:
+                async with pg_pool.acquire() as conn:
+                    await conn.fetch("SELECT 1")
+                postgres_ok = True
+            except:
+                postgres_ok = False
+
+        _health["redis"] = redis_ok
+        _health["postgres"] = postgres_ok
+        await asyncio.sleep(HEALTH_REFRESH_INTERVAL)
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    redis_ok = False
-    postgres_ok = False
-    
-    # Check Redis
-    if redis_pool:
-        try:
-            r = redis.Redis(connection_pool=redis_pool)
-            redis_ok = r.ping()
-        except:
-            redis_ok = False
-    
-    # Check PostgreSQL
-    if pg_pool:
-        try:
-            async with pg_pool.acquire() as conn:
-                await conn.fetch("SELECT 1")
-            postgres_ok = True
-        except:
-            postgres_ok = False
-    
+    # Served from the refresher's cached heartbeat — liveness probes
+    # from every pod no longer generate Redis/Postgres traffic
+    redis_ok = _health["redis"]
+    postgres_ok = _health["postgres"]
+
     uptime = (datetime.now() - start_time).total_seconds()
-    
+
     return HealthResponse(
         status="healthy" if redis_ok and postgres_ok else "degraded",
         redis=redis_ok,
@@ -153,32 +287,20 @@ async def health_check():
     )
 
 @app.post("/audit", response_model=AuditJobResponse)
-async def create_audit(request: AuditRequest, background_tasks: BackgroundTasks):
+async def create_audit(request: AuditRequest):
     """Create a new audit job"""
-    # Generate job ID
-    job_id = f"audit_{uuid.uuid4().hex[:8]}"
-    
-    # Validate cloud-specific IDs
-    if request.cloud_provider == "azure" and not request.subscription_id:
-        raise HTTPException(status_code=400, detail="subscription_id required for Azure")
-    elif request.cloud_provider == "aws" and not request.account_id:
-        raise HTTPException(status_code=400, detail="account_id required for AWS")
-    elif request.cloud_provider == "gcp" and not request.project_id:
-        raise HTTPException(status_code=400, detail="project_id required for GCP")
-    
-    # Create job in database
+    r = get_redis()
+
+    # Generate job ID: time-ordered with a Redis-atomic sequence, so IDs
+    # are collision-free and insert append-only into the B-tree (unlike
+    # the old random uuid4 prefix, which had only 32 bits of entropy)
     try:
-        async with (await get_pg_connection()).acquire() as conn:
-            await conn.execute("""
-                INSERT INTO audit_jobs 
-                (job_id, cloud_provider, subscription_id, account_id, project_id, checks, status)
-                VALUES ($1, $2, $3, $4, $5, $6, 'pending')
-            """, job_id, request.cloud_provider, request.subscription_id, 
-                request.account_id, request.project_id, request.checks)
+        seq = await r.incr("audit:id_seq")
     except Exception as e:
-        logger.error(f"Failed to create job in database: {e}")
+        logger.error(f"Failed to allocate job ID: {e}")
         raise HTTPException(status_code=500, detail="Failed to create audit job")
-    
+    job_id = f"audit_{int(time.time()):x}_{seq:x}"
+
     # Create audit tasks
     tasks = []
     for check in request.checks:
@@ -193,72 +315,125 @@ async def create_audit(request: AuditRequest, background_tasks: BackgroundTasks)
         }
         tasks.append(task)
     
-    # Queue tasks in Redis
-    r = get_redis()
+    # Queue tasks in Redis. Transport is deliberately three priority
+    # Lists consumed with blocking pops: workers get strict priority
+    # ordering for free, which Redis Streams only approximate (one
+    # stream per priority plus consumer-group bookkeeping). Revisit if
+    # we ever need at-least-once delivery across worker crashes.
     queue_name = f"audit_queue_{request.priority}"
     
     try:
-        for task in tasks:
-            r.lpush(queue_name, json.dumps(task))
-        
+        # Batch all LPUSHes plus the LLEN into one round-trip.
+        # transaction=False: ordering within a single client is already
+        # guaranteed, so MULTI/EXEC would only add overhead.
+        async with r.pipeline(transaction=False) as pipe:
+            for task in tasks:
+                # orjson emits bytes directly, which redis-py accepts
+                pipe.lpush(queue_name, orjson.dumps(task))
+            pipe.llen(queue_name)
+            results = await pipe.execute()
+
         # Get queue position
-        queue_len = r.llen(queue_name)
-        
-        # Update job status
-        async with (await get_pg_connection()).acquire() as conn:
-            await conn.execute(
-                "UPDATE audit_jobs SET status = 'queued' WHERE job_id = $1",
-                job_id
-            )
-        
-        # Start background processing
-        background_tasks.add_task(process_audit_tasks)
-        
-        return AuditJobResponse(
-            job_id=job_id,
-            status="queued",
-            message=f"Audit job created with {len(tasks)} tasks",
-            queue_position=queue_len
-        )
+        queue_len = results[-1]
     except Exception as e:
         logger.error(f"Failed to queue tasks: {e}")
-        async with (await get_pg_connection()).acquire() as conn:
+        async with get_pool().acquire() as conn:
             await conn.execute(
-                "UPDATE audit_jobs SET status = 'failed', error_message = $1 WHERE job_id = $2",
-                str(e), job_id
-            )
+                INSERT_FAILED_JOB_SQL,
+                job_id, request.cloud_provider, request.subscription_id,
+                request.account_id, request.project_id, request.checks, str(e))
         raise HTTPException(status_code=500, detail="Failed to queue audit tasks")
 
+    # Create job in database — tasks are already queued, so insert as
+    # 'queued' directly instead of INSERT 'pending' + UPDATE 'queued'
+    try:
+        async with get_pool().acquire() as conn:
+            await conn.execute(
+                INSERT_JOB_SQL,
+                job_id, request.cloud_provider, request.subscription_id,
+                request.account_id, request.project_id, request.checks)
+    except Exception as e:
+        logger.error(f"Failed to create job in database: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create audit job")
+
+    return AuditJobResponse(
+        job_id=job_id,
+        status="queued",
+        message=f"Audit job created with {len(tasks)} tasks",
+        queue_position=queue_len
+    )
+
+FINDINGS_COPY_COLUMNS = [
+    "job_id", "resource_id", "resource_type", "check_type",
+    "severity", "description", "recommendation", "metadata"
+]
+
+async def insert_findings(job_id: str, findings: List[Dict[str, Any]]):
+    """Bulk-insert findings for a job via COPY.
+
+    This is the supported path for persisting worker results: one COPY
+    stream instead of one INSERT round-trip per finding.
+    """
+    if not findings:
+        return
+    records = [
+        (
+            job_id,
+            f.get("resource_id"),
+            f.get("resource_type"),
+            f.get("check_type"),
+            f.get("severity"),
+            f.get("description"),
+            f.get("recommendation"),
+            json.dumps(f["metadata"]) if f.get("metadata") is not None else None
+        )
+        for f in findings
+    ]
+    async with get_pool().acquire() as conn:
+        await conn.copy_records_to_table(
+            "audit_findings",
+            records=records,
+            columns=FINDINGS_COPY_COLUMNS
+        )
+
 async def process_audit_tasks():
-    """Background task to monitor and process audit tasks"""
-    logger.info("Audit task processor started")
+    """Single long-lived queue monitor, spawned once at startup.
+
+    Actual task consumption happens in the worker tier; this coroutine
+    just watches queue depth for operators and autoscalers.
+    """
+    logger.info("Audit queue monitor started")
     while True:
         try:
             await asyncio.sleep(5)  # Check every 5 seconds
-            # In a real implementation, this would trigger workers
-            pass
+            r = get_redis()
+            async with r.pipeline(transaction=False) as pipe:
+                pipe.llen("audit_queue_high")
+                pipe.llen("audit_queue_medium")
+                pipe.llen("audit_queue_low")
+                high, medium, low = await pipe.execute()
+            if high or medium or low:
+                logger.debug(
+                    f"Queue depth: high={high} medium={medium} low={low}"
+                )
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error in task processor: {e}")
+            logger.error(f"Error in queue monitor: {e}")
             await asyncio.sleep(30)
 
 @app.get("/jobs/{job_id}")
 async def get_job_status(job_id: str):
     """Get status of an audit job"""
     try:
-        async with (await get_pg_connection()).acquire() as conn:
-            job = await conn.fetchrow(
-                "SELECT * FROM audit_jobs WHERE job_id = $1",
-                job_id
-            )
-            
+        async with get_pool().acquire() as conn:
+            # Single round-trip: fold the findings count into the job
+            # lookup via a scalar subquery
+            job = await conn.fetchrow(JOB_STATUS_SQL, job_id)
+
             if not job:
                 raise HTTPException(status_code=404, detail="Job not found")
-            
-            findings = await conn.fetch(
-                "SELECT COUNT(*) as count FROM audit_findings WHERE job_id = $1",
-                job_id
-            )
-            
+
             return {
                 "job_id": job["job_id"],
                 "status": job["status"],
@@ -266,7 +441,7 @@ async def get_job_status(job_id: str):
                 "created_at": job["created_at"],
                 "started_at": job["started_at"],
                 "completed_at": job["completed_at"],
-                "findings_count": findings[0]["count"] if findings else 0
+                "findings_count": job["findings_count"]
             }
     except HTTPException:
         raise
@@ -274,97 +449,154 @@ async def get_job_status(job_id: str):
         logger.error(f"Failed to get job status: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve job status")
 
+@app.post("/jobs/batch-status")
+async def get_batch_job_status(job_ids: List[str]):
+    """Get status for many jobs in one round-trip (avoids N+1 polling)"""
+    if not job_ids:
+        return {}
+    if len(job_ids) > 1000:
+        raise HTTPException(status_code=400, detail="Too many job IDs (max 1000)")
+    try:
+        async with get_pool().acquire() as conn:
+            jobs = await conn.fetch(BATCH_STATUS_SQL, job_ids)
+            counts = await conn.fetch(BATCH_FINDINGS_COUNT_SQL, job_ids)
+
+        count_by_job = {c["job_id"]: c["findings_count"] for c in counts}
+        return {
+            j["job_id"]: {**dict(j), "findings_count": count_by_job.get(j["job_id"], 0)}
+            for j in jobs
+        }
+    except Exception as e:
+        logger.error(f"Failed to get batch job status: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve job statuses")
+
+def _decode_findings_cursor(cursor: str):
+    """Decode an opaque '<created_at>|<id>' keyset cursor"""
+    try:
+        ts, _, row_id = cursor.partition("|")
+        return datetime.fromisoformat(ts), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @app.get("/jobs/{job_id}/findings")
-async def get_job_findings(job_id: str, severity: Optional[str] = None):
-    """Get findings for a job"""
+async def get_job_findings(
+    job_id: str,
+    severity: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None
+):
+    """Get findings for a job (keyset-paginated, newest first)"""
+    limit = max(1, min(limit, 1000))
+
+    # Constant query texts (instead of string concatenation) so every
+    # variant hits the statement cache
+    if cursor:
+        after_ts, after_id = _decode_findings_cursor(cursor)
+        if severity:
+            query = FINDINGS_BY_SEVERITY_AFTER_SQL
+            params = (job_id, severity, after_ts, after_id, limit)
+        else:
+            query = FINDINGS_AFTER_SQL
+            params = (job_id, after_ts, after_id, limit)
+    elif severity:
+        query = FINDINGS_BY_SEVERITY_SQL
+        params = (job_id, severity, limit)
+    else:
+        query = FINDINGS_SQL
+        params = (job_id, limit)
+
     try:
-        async with (await get_pg_connection()).acquire() as conn:
-            # Verify job exists
-            job = await conn.fetchrow(
-                "SELECT job_id FROM audit_jobs WHERE job_id = $1",
-                job_id
-            )
+        # Verify job exists before committing to a streamed response
+        async with get_pool().acquire() as conn:
+            job = await conn.fetchrow(JOB_EXISTS_SQL, job_id)
             if not job:
                 raise HTTPException(status_code=404, detail="Job not found")
-            
-            # Build query
-            query = "SELECT * FROM audit_findings WHERE job_id = $1"
-            params = [job_id]
-            
-            if severity:
-                query += " AND severity = $2"
-                params.append(severity)
-            
-            query += " ORDER BY created_at DESC"
-            
-            findings = await conn.fetch(query, *params)
-            
-            return {
-                "job_id": job_id,
-                "findings": [
-                    {
-                        "id": f["id"],
-                        "resource_id": f["resource_id"],
-                        "resource_type": f["resource_type"],
-                        "check_type": f["check_type"],
-                        "severity": f["severity"],
-                        "description": f["description"],
-                        "recommendation": f["recommendation"],
-                        "created_at": f["created_at"]
-                    }
-                    for f in findings
-                ]
-            }
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to get findings: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve findings")
 
+    async def stream_findings():
+        # Stream rows through an async cursor instead of materializing
+        # the whole page: constant memory, first bytes on the wire as
+        # soon as the first prefetch batch arrives. dict(Record) is a
+        # single C-level conversion; orjson handles datetimes natively.
+        yield b'{"job_id":' + orjson.dumps(job_id) + b',"findings":['
+        row_count = 0
+        last = None
+        async with get_pool().acquire() as conn:
+            async with conn.transaction():
+                async for row in conn.cursor(query, *params, prefetch=500):
+                    if row_count:
+                        yield b","
+                    yield orjson.dumps(dict(row))
+                    row_count += 1
+                    last = row
+        # Keyset cursor from the last row; a short page means we
+        # reached the end
+        if row_count == limit:
+            next_cursor = f"{last['created_at'].isoformat()}|{last['id']}"
+            yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+        else:
+            yield b'],"next_cursor":null}'
+
+    return StreamingResponse(stream_findings(), media_type="application/json")
+
 @app.get("/metrics")
 async def get_metrics():
     """Get system metrics"""
+    # Serve from cache while fresh; the lock's double-check makes
+    # concurrent pollers wait for one recompute instead of stampeding
+    if time.monotonic() - _metrics_cache["ts"] < METRICS_CACHE_TTL:
+        return _metrics_cache["value"]
+
     try:
-        r = get_redis()
-        
-        # Get queue lengths
-        high_queue_len = r.llen("audit_queue_high") or 0
-        medium_queue_len = r.llen("audit_queue_medium") or 0
-        low_queue_len = r.llen("audit_queue_low") or 0
-        
-        # Get database stats
-        async with (await get_pg_connection()).acquire() as conn:
-            job_stats = await conn.fetchrow("""
-                SELECT 
-                    COUNT(*) as total_jobs,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_jobs,
-                    COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_jobs
-                FROM audit_jobs
-            """)
-            
-            finding_stats = await conn.fetchrow("""
-                SELECT 
-                    COUNT(*) as total_findings,
-                    COUNT(CASE WHEN severity = 'high' THEN 1 END) as high_findings,
-                    COUNT(CASE WHEN severity = 'medium' THEN 1 END) as medium_findings,
-                    COUNT(CASE WHEN severity = 'low' THEN 1 END) as low_findings
-                FROM audit_findings
-            """)
-        
-        return {
-            "queues": {
-                "high": high_queue_len,
-                "medium": medium_queue_len,
-                "low": low_queue_len
-            },
-            "jobs": dict(job_stats) if job_stats else {},
-            "findings": dict(finding_stats) if finding_stats else {},
-            "uptime": (datetime.now() - start_time).total_seconds()
-        }
+        async with _metrics_lock:
+            if time.monotonic() - _metrics_cache["ts"] < METRICS_CACHE_TTL:
+                return _metrics_cache["value"]
+            return await _compute_metrics()
     except Exception as e:
         logger.error(f"Failed to get metrics: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve metrics")
 
+async def _compute_metrics():
+    r = get_redis()
+
+    async def fetch_stats(sql):
+        async with get_pool().acquire() as conn:
+            return await conn.fetchrow(sql)
+
+    async def fetch_queue_lengths():
+        async with r.pipeline(transaction=False) as pipe:
+            pipe.llen("audit_queue_high")
+            pipe.llen("audit_queue_medium")
+            pipe.llen("audit_queue_low")
+            return await pipe.execute()
+
+    # The aggregates and queue lengths are independent — run them
+    # concurrently instead of five serial round-trips
+    job_stats, finding_stats, queue_lens = await asyncio.gather(
+        fetch_stats(JOB_STATS_SQL),
+        fetch_stats(FINDING_STATS_SQL),
+        fetch_queue_lengths()
+    )
+
+    metrics = {
+        "queues": {
+            "high": queue_lens[0] or 0,
+            "medium": queue_lens[1] or 0,
+            "low": queue_lens[2] or 0
+        },
+        "jobs": dict(job_stats) if job_stats else {},
+        "findings": dict(finding_stats) if finding_stats else {},
+        "uptime": (datetime.now() - start_time).total_seconds()
+    }
+
+    _metrics_cache["value"] = metrics
+    _metrics_cache["ts"] = time.monotonic()
+    return metrics
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -6,14 +6,31 @@ import logging
 import asyncio
 import signal
 import sys
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Dict, Any, List
 
-import redis
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.resource import ResourceManagementClient
-import boto3
-from botocore.exceptions import ClientError
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+# The cloud SDKs are imported lazily in initialize_cloud_clients —
+# boto3 alone costs hundreds of ms at import, which single-provider
+# workers shouldn't pay for clouds they never touch
+
+# orjson is a C extension roughly 5-10x faster than stdlib json and
+# emits bytes directly; fall back to stdlib where it isn't installed
+try:
+    import orjson
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, default=str)
+
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj):
+        return json.dumps(obj, default=str).encode()
+
+    json_loads = json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -35,18 +52,43 @@ class AuditWorker:
         redis_host = os.getenv("REDIS_HOST", "localhost")
         redis_port = int(os.getenv("REDIS_PORT", "6379"))
         
-        self.redis_client = redis.Redis(
+        # decode_responses=False: task payloads come back as bytes,
+        # which json_loads consumes without a decode pass
+        self.redis_client = aioredis.Redis(
             host=redis_host,
             port=redis_port,
-            decode_responses=True,
+            decode_responses=False,
             socket_connect_timeout=10,
-            retry_on_timeout=True
+            retry_on_timeout=True,
+            max_connections=32
         )
         
         # Initialize cloud clients
         self.azure_credential = None
         self.aws_session = None
-        
+
+        # Cached SDK clients so repeated tasks reuse the underlying
+        # HTTPS connection pools instead of re-handshaking
+        self._azure_clients: "OrderedDict[str, Any]" = OrderedDict()
+        self._boto_clients: Dict[str, Any] = {}
+
+        # Shared HTTP session (Azure) and botocore config (AWS), built
+        # alongside the lazy SDK imports on first use
+        self._http_session = None
+        self.boto_config = None
+
+        # Locally buffered task counter, flushed to Redis periodically
+        # instead of one HINCRBY round-trip per task
+        self._metric_buf = 0
+
+        # Provider dispatch table — built once instead of an if/elif
+        # ladder per task, and extended without touching process_task
+        self._dispatch = {
+            "azure": self.audit_azure,
+            "aws": self.audit_aws,
+            "gcp": self.audit_gcp
+        }
+
         logger.info(f"Worker {self.worker_id} initialized")
     
     def signal_handler(self, signum, frame):
@@ -54,17 +96,41 @@ class AuditWorker:
         self.running = False
     
     def initialize_cloud_clients(self, cloud_provider: str):
-        """Lazy initialization of cloud clients"""
+        """Lazy initialization of cloud clients (and their SDK imports)"""
         if cloud_provider == "azure" and self.azure_credential is None:
             try:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from azure.identity import DefaultAzureCredential
+
+                # One HTTP session shared by every Azure client so calls
+                # across all subscriptions reuse pooled HTTPS connections
+                # instead of re-handshaking per client
+                self._http_session = requests.Session()
+                self._http_session.mount('https://', HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=64,
+                    max_retries=3
+                ))
                 self.azure_credential = DefaultAzureCredential()
                 logger.info("Azure credential initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize Azure credential: {e}")
                 raise
-        
+
         elif cloud_provider == "aws" and self.aws_session is None:
             try:
+                import boto3
+                from botocore.config import Config as BotoConfig
+
+                # One shared config for every boto3 client: the default
+                # pool of 10 connections forces fresh TLS handshakes once
+                # fan-out exceeds it
+                self.boto_config = BotoConfig(
+                    max_pool_connections=64,
+                    tcp_keepalive=True,
+                    retries={'mode': 'adaptive', 'max_attempts': 5}
+                )
                 # AWS credentials should be set via environment variables
                 # AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_REGION
                 self.aws_session = boto3.Session()
@@ -73,6 +139,39 @@ class AuditWorker:
                 logger.error(f"Failed to initialize AWS session: {e}")
                 raise
     
+    MAX_CACHED_AZURE_CLIENTS = 32
+
+    # Per-bucket error codes that mean "nothing to report", not "warn" —
+    # checked by code lookup, never by scanning the exception message
+    TOLERATED_S3_ERROR_CODES = frozenset({'AccessDenied', 'NoSuchBucket'})
+
+    def _azure_resource_client(self, subscription_id: str):
+        """LRU-cached ResourceManagementClient per subscription"""
+        from azure.core.pipeline.transport import RequestsTransport
+        from azure.mgmt.resource import ResourceManagementClient
+
+        client = self._azure_clients.get(subscription_id)
+        if client is None:
+            client = ResourceManagementClient(
+                self.azure_credential,
+                subscription_id,
+                transport=RequestsTransport(session=self._http_session)
+            )
+            self._azure_clients[subscription_id] = client
+            if len(self._azure_clients) > self.MAX_CACHED_AZURE_CLIENTS:
+                self._azure_clients.popitem(last=False)
+        else:
+            self._azure_clients.move_to_end(subscription_id)
+        return client
+
+    def _boto_client(self, service: str):
+        """Memoized boto3 clients; sharing a client shares its connection pool"""
+        client = self._boto_clients.get(service)
+        if client is None:
+            client = self.aws_session.client(service, config=self.boto_config)
+            self._boto_clients[service] = client
+        return client
+
     async def process_task(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process a single audit task"""
         findings = []
@@ -81,19 +180,16 @@ class AuditWorker:
             cloud_provider = task.get("cloud_provider")
             check_type = task.get("check_type", "security")
             
-            # Initialize cloud client
-            self.initialize_cloud_clients(cloud_provider)
-            
-            if cloud_provider == "azure":
-                findings = await self.audit_azure(task)
-            elif cloud_provider == "aws":
-                findings = await self.audit_aws(task)
-            elif cloud_provider == "gcp":
-                findings = await self.audit_gcp(task)
-            else:
+            handler = self._dispatch.get(cloud_provider)
+            if handler is None:
                 logger.error(f"Unsupported cloud provider: {cloud_provider}")
                 return []
-            
+
+            # Initialize cloud client
+            self.initialize_cloud_clients(cloud_provider)
+
+            findings = await handler(task)
+
             logger.info(f"Found {len(findings)} issues in {cloud_provider}")
             return findings
             
@@ -126,30 +222,45 @@ class AuditWorker:
             }]
         
         try:
-            # Initialize Azure client
-            resource_client = ResourceManagementClient(
-                self.azure_credential,
-                subscription_id
-            )
+            # Initialize Azure client (cached per subscription)
+            resource_client = self._azure_resource_client(subscription_id)
             
-            # Check 1: List resource groups (basic connectivity test)
+            # Check 1: List resource groups (basic connectivity test).
+            # The SDK calls are blocking HTTP — run them in threads so
+            # the event loop keeps servicing Redis and sibling coroutines
             try:
-                resource_groups = list(resource_client.resource_groups.list())
-                
-                if not resource_groups:
-                    findings.append({
-                        "resource_id": subscription_id,
-                        "resource_type": "subscription",
-                        "check_type": "security",
-                        "severity": "low",
-                        "description": "No resource groups found in subscription",
-                        "recommendation": "This might be a new subscription",
-                        "metadata": {"subscription_id": subscription_id}
-                    })
-                else:
-                    # Check for empty resource groups
-                    for rg in resource_groups:
-                        resources = list(resource_client.resources.list_by_resource_group(rg.name))
+                # Check for empty resource groups — fan the per-RG
+                # listings out concurrently; the semaphore keeps us
+                # inside the SDK's HTTPS connection pool
+                sem = asyncio.Semaphore(16)
+
+                async def list_rg_resources(rg):
+                    async with sem:
+                        return await asyncio.to_thread(
+                            lambda: list(resource_client.resources.list_by_resource_group(rg.name))
+                        )
+
+                # Walk the pageable page by page, prefetching the next
+                # page while the current page's per-RG listings run, so
+                # page fetch and processing overlap
+                pages = resource_client.resource_groups.list().by_page()
+                next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+                seen_any = False
+
+                while True:
+                    page = await next_page
+                    if page is None:
+                        break
+                    next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+
+                    page_rgs = list(page)
+                    seen_any = seen_any or bool(page_rgs)
+
+                    page_resources = await asyncio.gather(
+                        *[list_rg_resources(rg) for rg in page_rgs]
+                    )
+
+                    for rg, resources in zip(page_rgs, page_resources):
                         if not resources:
                             findings.append({
                                 "resource_id": rg.id,
@@ -160,6 +271,17 @@ class AuditWorker:
                                 "recommendation": "Consider deleting empty resource groups",
                                 "metadata": {"resource_group": rg.name}
                             })
+
+                if not seen_any:
+                    findings.append({
+                        "resource_id": subscription_id,
+                        "resource_type": "subscription",
+                        "check_type": "security",
+                        "severity": "low",
+                        "description": "No resource groups found in subscription",
+                        "recommendation": "This might be a new subscription",
+                        "metadata": {"subscription_id": subscription_id}
+                    })
             
             except Exception as e:
                 findings.append({
@@ -178,23 +300,54 @@ class AuditWorker:
             logger.error(f"Azure audit failed: {e}")
             raise
     
+    def _bucket_is_public(self, s3, bucket_name: str) -> bool:
+        """Check whether a bucket is publicly accessible.
+
+        Uses the account's public-access-block configuration (four
+        booleans) and the server-side evaluated policy status instead of
+        pulling and scanning the full ACL grant list.
+        """
+        from botocore.exceptions import ClientError
+
+        try:
+            pab = s3.get_public_access_block(Bucket=bucket_name)
+            config = pab['PublicAccessBlockConfiguration']
+            if (config.get('BlockPublicAcls') and config.get('IgnorePublicAcls')
+                    and config.get('BlockPublicPolicy') and config.get('RestrictPublicBuckets')):
+                return False
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code != 'NoSuchPublicAccessBlockConfiguration':
+                raise
+
+        try:
+            status = s3.get_bucket_policy_status(Bucket=bucket_name)
+            return bool(status['PolicyStatus'].get('IsPublic'))
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code == 'NoSuchBucketPolicy':
+                return False
+            raise
+
     async def audit_aws(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Audit AWS resources"""
+        from botocore.exceptions import ClientError
+
         findings = []
         account_id = task.get("account_id")
         
         try:
             # Test AWS connectivity
-            sts = self.aws_session.client('sts')
+            sts = self._boto_client('sts')
             
-            # Get caller identity
-            identity = sts.get_caller_identity()
+            # Get caller identity (blocking HTTP — offload to a thread)
+            identity = await asyncio.to_thread(sts.get_caller_identity)
             logger.info(f"AWS Identity: {identity['Arn']}")
             
             # Check S3 buckets
-            s3 = self.aws_session.client('s3')
+            s3 = self._boto_client('s3')
             try:
-                buckets = s3.list_buckets()
+                buckets = await asyncio.to_thread(s3.list_buckets)
                 
                 if not buckets.get('Buckets'):
                     findings.append({
@@ -207,26 +360,30 @@ class AuditWorker:
                         "metadata": {"account_id": identity.get('Account')}
                     })
                 else:
-                    # Check for public buckets
-                    for bucket in buckets['Buckets']:
-                        try:
-                            acl = s3.get_bucket_acl(Bucket=bucket['Name'])
-                            for grant in acl.get('Grants', []):
-                                grantee = grant.get('Grantee', {})
-                                if grantee.get('URI') == 'http://acs.amazonaws.com/groups/global/AllUsers':
-                                    findings.append({
-                                        "resource_id": bucket['Name'],
-                                        "resource_type": "s3_bucket",
-                                        "check_type": "security",
-                                        "severity": "high",
-                                        "description": f"S3 bucket '{bucket['Name']}' is publicly accessible",
-                                        "recommendation": "Review and restrict bucket permissions",
-                                        "metadata": {"bucket_name": bucket['Name']}
-                                    })
-                                    break
-                        except ClientError as e:
-                            # Some buckets may not allow ACL checks
-                            if 'AccessDenied' not in str(e):
+                    # Check for public buckets — run the checks
+                    # concurrently in threads, bounded well under
+                    # max_pool_connections
+                    sem = asyncio.Semaphore(32)
+
+                    async def check_public(bucket):
+                        async with sem:
+                            return await asyncio.to_thread(
+                                self._bucket_is_public, s3, bucket['Name']
+                            )
+
+                    results = await asyncio.gather(
+                        *[check_public(b) for b in buckets['Buckets']],
+                        return_exceptions=True
+                    )
+
+                    for bucket, is_public in zip(buckets['Buckets'], results):
+                        if isinstance(is_public, ClientError):
+                            # Some buckets may not allow access checks —
+                            # an O(1) code lookup, not a substring scan
+                            # over the formatted message
+                            e = is_public
+                            code = e.response.get('Error', {}).get('Code')
+                            if code not in self.TOLERATED_S3_ERROR_CODES:
                                 findings.append({
                                     "resource_id": bucket['Name'],
                                     "resource_type": "s3_bucket",
@@ -236,6 +393,20 @@ class AuditWorker:
                                     "recommendation": "Ensure proper permissions for audit",
                                     "metadata": {"error": str(e), "bucket_name": bucket['Name']}
                                 })
+                            continue
+                        elif isinstance(is_public, BaseException):
+                            raise is_public
+
+                        if is_public:
+                            findings.append({
+                                "resource_id": bucket['Name'],
+                                "resource_type": "s3_bucket",
+                                "check_type": "security",
+                                "severity": "high",
+                                "description": f"S3 bucket '{bucket['Name']}' is publicly accessible",
+                                "recommendation": "Review and restrict bucket permissions",
+                                "metadata": {"bucket_name": bucket['Name']}
+                            })
             
             except ClientError as e:
                 findings.append({
@@ -283,66 +454,141 @@ class AuditWorker:
         
         return findings
     
-    async def run(self):
-        """Main worker loop"""
-        logger.info(f"Worker {self.worker_id} starting...")
-        
+    async def _flush_metric_buf(self):
+        """Push the buffered task count to Redis in one HINCRBY"""
+        if self._metric_buf:
+            count, self._metric_buf = self._metric_buf, 0
+            try:
+                await self.redis_client.hincrby("worker_metrics", self.worker_id, count)
+            except Exception as e:
+                logger.error(f"Failed to flush worker metrics: {e}")
+                self._metric_buf += count  # retry on the next flush
+
+    async def _flush_metrics_loop(self):
+        while self.running:
+            await asyncio.sleep(5)
+            await self._flush_metric_buf()
+
+    async def _handle_task(self, queue_name: bytes, task_data: bytes):
+        """Process one popped task end-to-end"""
+        task = json_loads(task_data)
+
+        # Hoist the repeated lookups and key strings once per task
+        # instead of rebuilding them per finding
+        job_id = task.get("job_id")
+        check_type = task.get("check_type")
+        findings_key = f"findings:{job_id}"
+        processed_key = f"processed:{job_id}:{check_type}"
+
+        # Skip tasks a sibling worker already handled (the processed
+        # marker lives for an hour) — one cheap EXISTS instead of a
+        # duplicate cloud audit
+        if await self.redis_client.exists(processed_key):
+            logger.info(f"Skipping duplicate task: {job_id}:{check_type}")
+            return
+
+        logger.info(f"Processing task: {job_id} (from {queue_name.decode()})")
+
+        # Process the task
+        findings = await self.process_task(task)
+
+        # Stamp and serialize everything in one comprehension so the
+        # CPU work finishes before the network phase begins. All
+        # findings share one timestamp — no point formatting it per
+        # finding
+        processed_at = datetime.now(timezone.utc).isoformat()
+        serialized = [
+            json_dumps({
+                **finding,
+                "job_id": job_id,
+                "worker_id": self.worker_id,
+                "processed_at": processed_at
+            })
+            for finding in findings
+        ]
+
+        # One pipeline for findings and the processed marker — LPUSH is
+        # variadic, so all findings go in one command and the whole
+        # phase is a single round-trip
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            if serialized:
+                pipe.lpush(findings_key, *serialized)
+            pipe.setex(processed_key, 3600, "true")
+            await pipe.execute()
+
+        # Update metrics (buffered; flushed in the background)
+        self._metric_buf += 1
+
+    async def _produce_tasks(self, queue: asyncio.Queue, consumer_count: int):
+        """Feed popped tasks into the local queue until shutdown"""
         while self.running:
             try:
-                # Try to get a task from Redis (blocking pop)
-                # Try high priority first, then medium, then low
-                for priority in ['high', 'medium', 'low']:
-                    queue_name = f"audit_queue_{priority}"
-                    
-                    # Non-blocking pop
-                    task_data = self.redis_client.lpop(queue_name)
-                    
-                    if task_data:
-                        task = json.loads(task_data)
-                        logger.info(f"Processing task: {task.get('job_id')} ({priority} priority)")
-                        
-                        # Process the task
-                        findings = await self.process_task(task)
-                        
-                        # Store findings in Redis
-                        if findings:
-                            for finding in findings:
-                                finding["job_id"] = task.get("job_id")
-                                finding["worker_id"] = self.worker_id
-                                finding["processed_at"] = datetime.utcnow().isoformat()
-                                
-                                # Push to findings list
-                                self.redis_client.lpush(
-                                    f"findings:{task.get('job_id')}",
-                                    json.dumps(finding)
-                                )
-                        
-                        # Mark task as processed
-                        processed_key = f"processed:{task.get('job_id')}:{task.get('check_type')}"
-                        self.redis_client.setex(processed_key, 3600, "true")
-                        
-                        # Update metrics
-                        self.redis_client.hincrby("worker_metrics", self.worker_id, 1)
-                        
-                        # Short break between tasks
-                        await asyncio.sleep(0.1)
-                        break
-                
-                # If no tasks, sleep a bit
-                await asyncio.sleep(1)
-                
-            except redis.exceptions.ConnectionError as e:
+                # Blocking pop across all three queues at once — BRPOP
+                # checks the keys in argument order, so high priority
+                # wins, and the server wakes us the moment work arrives
+                popped = await self.redis_client.brpop(
+                    ["audit_queue_high", "audit_queue_medium", "audit_queue_low"],
+                    timeout=5
+                )
+                if popped:
+                    await queue.put(popped)
+            except RedisConnectionError as e:
                 logger.error(f"Redis connection error: {e}")
                 await asyncio.sleep(5)  # Wait before retry
-                
-            except json.JSONDecodeError as e:
+            except Exception as e:
+                logger.error(f"Unexpected error in task producer: {e}")
+                await asyncio.sleep(5)
+
+        # Wake each consumer so it can exit
+        for _ in range(consumer_count):
+            await queue.put(None)
+
+    async def _consume_tasks(self, queue: asyncio.Queue):
+        """Run tasks from the local queue until the producer signals stop"""
+        while True:
+            popped = await queue.get()
+            try:
+                if popped is None:
+                    return
+                queue_name, task_data = popped
+                await self._handle_task(queue_name, task_data)
+            except ValueError as e:
+                # Covers both json.JSONDecodeError and orjson.JSONDecodeError;
+                # the bad payload is already popped, so just move on
                 logger.error(f"Failed to parse task JSON: {e}")
-                await asyncio.sleep(1)
-                
+            except RedisConnectionError as e:
+                logger.error(f"Redis connection error: {e}")
+                await asyncio.sleep(5)  # Wait before retry
             except Exception as e:
-                logger.error(f"Unexpected error in worker loop: {e}")
+                logger.error(f"Unexpected error in task consumer: {e}")
                 await asyncio.sleep(5)
-        
+            finally:
+                queue.task_done()
+
+    async def run(self):
+        """Main worker loop: one producer, several concurrent consumers.
+
+        process_task is almost entirely IO-bound waiting on cloud APIs,
+        so a handful of in-flight audits share one Redis connection and
+        the cached SDK clients. The bounded queue keeps us from popping
+        more tasks than we can work on.
+        """
+        logger.info(f"Worker {self.worker_id} starting...")
+
+        flush_task = asyncio.create_task(self._flush_metrics_loop())
+
+        concurrency = int(os.getenv("WORKER_CONCURRENCY", "8"))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+
+        await asyncio.gather(
+            self._produce_tasks(queue, concurrency),
+            *[self._consume_tasks(queue) for _ in range(concurrency)]
+        )
+
+        # Final flush so no counted tasks are lost on shutdown
+        flush_task.cancel()
+        await self._flush_metric_buf()
+
         logger.info(f"Worker {self.worker_id} stopped")
 
 async def main():